@@ -0,0 +1,47 @@
+"""Write a parquet copy next to each csv dataset in `src/pytimetk/datasets`.
+
+Run this after adding or updating a csv dataset:
+
+    python scripts/write_parquet_datasets.py
+
+Columns that `pandas.read_csv(parse_dates=[col])` turns into datetimes are 
+stored as native datetimes. `pytimetk.load_dataset` reads the parquet copy when 
+`parse_dates` lists exactly those columns, and the csv otherwise.
+"""
+
+import warnings
+from pathlib import Path
+
+import pandas as pd
+
+DATASETS_DIR = Path(__file__).resolve().parents[1] / "src" / "pytimetk" / "datasets"
+
+
+def get_date_columns(csv_path):
+    df = pd.read_csv(csv_path)
+    
+    date_columns = []
+    for col in df.columns[df.dtypes == object]:
+        # Non-date columns warn that their format could not be inferred
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)
+            parsed = pd.read_csv(csv_path, usecols=[col], parse_dates=[col])
+        
+        if pd.api.types.is_datetime64_any_dtype(parsed[col]):
+            date_columns.append(col)
+    
+    return date_columns
+
+
+def main():
+    for csv_path in sorted(DATASETS_DIR.glob("*.csv")):
+        date_columns = get_date_columns(csv_path)
+        
+        df = pd.read_csv(csv_path, parse_dates=date_columns)
+        df.to_parquet(csv_path.with_suffix(".parquet"), compression="snappy", index=False)
+        
+        print(f"{csv_path.stem}: {date_columns}")
+
+
+if __name__ == "__main__":
+    main()
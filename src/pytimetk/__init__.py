@@ -12,9 +12,7 @@ from .core.summarize_by_time import *
 from .core.apply_by_time import *
 from .core.pad import *
 from .core.filter_by_time import *
-from .core.future import *
 from .core.make_timeseries_sequence import *
-from .core.make_future_timeseries import *
 from .core.ts_features import *
 from .core.ts_summary import *
 from .core.anomalize import *
@@ -3,17 +3,31 @@ import numpy as np
 import pandas_flavor as pf
 from typing import Union, Optional, List
 
+from pandas.tseries import offsets
+from pandas.tseries.offsets import Day, Tick
+
 from pytimetk.core.frequency import get_frequency
 from pytimetk.core.make_future_timeseries import make_future_timeseries
 
 from pytimetk.utils.checks import check_dataframe_or_groupby, check_date_column
+from pytimetk.utils.datetime_helpers import _get_offset
 
 from pytimetk.utils.parallel_helpers import conditional_tqdm, get_threads
 
-from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 from pytimetk.utils.memory_helpers import reduce_memory_usage
 
+try:
+    from numba import njit, prange
+    _NUMBA_INSTALLED = True
+except ImportError:
+    _NUMBA_INSTALLED = False
+
+# Outputs smaller than this are faster with NumPy than with the numba kernel
+_NUMBA_MIN_SIZE = 1_000_000
+
 @pf.register_dataframe_method
 def future_frame(
     data: Union[pd.DataFrame, pd.core.groupby.generic.DataFrameGroupBy],
@@ -44,9 +58,14 @@ def future_frame(
         column in the DataFrame that contains the dates. This column will be 
         used to generate future dates.
     freq : str, optional
+        The `freq` parameter is a string that specifies the frequency of the 
+        future dates. If `freq` is set to `None`, the frequency is inferred 
+        from the data. For grouped data, it is inferred from the last 256 
+        dates of the first group. The default value is `None`.
     length_out : int
         The `length_out` parameter specifies the number of future dates to be 
-        added to the DataFrame.
+        added to the DataFrame. If `length_out` is 0 or less, no dates are 
+        added.
     force_regular : bool, optional
         The `force_regular` parameter is a boolean flag that determines whether 
         the frequency of the future dates should be forced to be regular. If 
@@ -69,7 +88,9 @@ def future_frame(
     show_progress : bool, optional
         A boolean parameter that determines whether to display progress using tqdm. 
         If set to True, progress will be displayed. If set to False, progress 
-        will not be displayed.
+        will not be displayed. Progress is only shown for grouped data whose 
+        future dates are computed group by group (calendar frequencies that 
+        are not vectorized); the vectorized single pass shows no progress bar.
     reduce_memory : bool, optional
         The `reduce_memory` parameter is used to specify whether to reduce the memory usage of the DataFrame by converting int, float to smaller bytes and str to categorical data. This reduces memory for large data but may impact resolution of float and will change str to categorical. Default is True.
     engine : str, optional
@@ -91,6 +112,12 @@ def future_frame(
     datasets with many time series groups: 
     
     - We vectorize where possible and use parallel processing to speed up. 
+    - Fixed frequencies (e.g. hourly, daily) and common calendar frequencies 
+      (e.g. weekly, month ends, business days) on timezone-naive dates are 
+      computed for all groups in a single vectorized pass. Parallel processing 
+      is only used for the remaining calendar frequencies.
+    - Use `groupby(..., sort = False)` to skip sorting the group keys. This 
+      is faster and preserves the original order of the groups.
     - The `threads` parameter controls the number of threads to use for parallel 
       processing.
     
@@ -223,7 +250,8 @@ def future_frame(
     
     
 # Monkey patch the method to pandas groupby objects
-pd.core.groupby.generic.DataFrameGroupBy.future_frame = future_frame
+if not hasattr(pd.core.groupby.generic.DataFrameGroupBy, 'future_frame'):
+    pd.core.groupby.generic.DataFrameGroupBy.future_frame = future_frame
 
 def _future_frame_pandas(
     data: Union[pd.DataFrame, pd.core.groupby.generic.DataFrameGroupBy],
@@ -236,6 +264,18 @@ def _future_frame_pandas(
     show_progress: bool = True
 ):
     
+    # Nothing to extend: return the data (or an empty future frame) as is
+    if length_out <= 0:
+        if isinstance(data, pd.DataFrame):
+            data, future_columns = data, [date_column]
+        else:
+            data, future_columns = data.obj, [date_column, *data.grouper.names]
+        
+        if bind_data:
+            return data.reset_index(drop=True)
+        
+        return data[future_columns].iloc[:0].reset_index(drop=True)
+    
     if isinstance(data, pd.DataFrame):
         ts_series = data[date_column]
             
@@ -270,48 +310,65 @@ def _future_frame_pandas(
         
         # If freq is None, infer the frequency from the first series in the data
         if freq is None:
-            label_of_first_group = list(data.groups.keys())[0]
+            # Iterating yields the first group without building the full 
+            # `data.groups` mapping
+            first_group = next(iter(data))[1]
             
-            first_group = data.get_group(label_of_first_group)
+            # Only a short consecutive run of dates is needed to infer the 
+            # frequency, so the (usually already sorted) tail is used rather 
+            # than sorting the whole group. 256 dates are plenty to detect 
+            # weekly patterns such as business days.
+            sample = first_group[date_column].iloc[-256:].sort_values()
             
-            freq = get_frequency(first_group[date_column].sort_values(), force_regular=force_regular)
+            freq = get_frequency(sample, force_regular=force_regular)
         
-        last_dates_df = data.agg({date_column: 'max'}).reset_index()
+        last_dates_df = data[date_column].max().reset_index()
+        last_dates = last_dates_df[date_column]
 
-        # Use parallel processing if threads is greater than 1
-        if threads != 1:
+        # Fixed and anchored calendar frequencies are vectorized across all 
+        # groups in a single pass, so parallel processing is only used for the 
+        # remaining calendar frequencies with more than one group
+        if threads != 1 and data.ngroups > 1 and not _is_vectorized_offset(_get_offset(freq), last_dates.dt.tz):
             
             threads = get_threads(threads)
             
-            chunk_size = int(len(last_dates_df) / threads)
-            subsets = [last_dates_df.iloc[i:i + chunk_size] for i in range(0, len(last_dates_df), chunk_size)]
+            # Split the groups into at most `threads` near-equal chunks
+            n_chunks = max(min(threads, len(last_dates)), 1)
+            chunks = [chunk for chunk in np.array_split(np.arange(len(last_dates)), n_chunks) if len(chunk)]
+            
+            # Use partial to "freeze" arguments for _compute_future_ns
+            func = partial(
+                _compute_future_ns, 
+                length_out=length_out, 
+                freq=freq
+            )
+            
+            # Workers only generate the dates. The frame is assembled once, here.
+            future_ns = np.empty(len(last_dates) * length_out, dtype='i8')
             
-            future_dates_list = []
             with ProcessPoolExecutor(max_workers=threads) as executor:
-                results = list(conditional_tqdm(executor.map(_process_future_frame_subset, subsets, 
-                                                [date_column] * len(subsets),
-                                                [group_names] * len(subsets),
-                                                [length_out] * len(subsets),
-                                                [freq] * len(subsets), 
-                                                [force_regular] * len(subsets)),
-                                    total=len(subsets), display= show_progress,
-                                    desc = "Future framing..."))
-                for future_dates_subset in results:
-                    future_dates_list.extend(future_dates_subset)
+                futures = {
+                    executor.submit(func, last_dates.iloc[chunk]): chunk[0] 
+                    for chunk in chunks
+                }
+                
+                for future in conditional_tqdm(as_completed(futures), total=len(futures), display=show_progress, desc="Future framing..."):
+                    subset_ns = future.result()
+                    start = futures[future] * length_out
+                    future_ns[start:start + len(subset_ns)] = subset_ns
+            
+            future_dates = _utc_ns_to_dates(future_ns, last_dates.dt.tz)
         
         # Use non-parallel processing if threads is 1
         else:
-            future_dates_list = []
-            for _, row in conditional_tqdm(last_dates_df.iterrows(), total=len(last_dates_df), disable=not show_progress, display=show_progress,desc="Future framing..."):
-                future_dates_subset = _process_future_frame_rows(
-                    row, date_column, group_names, length_out, freq, force_regular
-                )
-                future_dates_list.append(future_dates_subset)
+            future_dates = _make_future_dates(last_dates, length_out, freq, show_progress)
         
-        future_dates_df = pd.concat(future_dates_list, axis=0).reset_index(drop=True)
+        future_dates_df = _assemble_future_frame(
+            last_dates_df, future_dates, date_column, group_names, length_out
+        )
         
         if bind_data:
-            extended_df = pd.concat([data.obj, future_dates_df], axis=0).reset_index(drop=True)
+            extended_df = pd.concat([data.obj, future_dates_df], axis=0, ignore_index=True)
         else:
             extended_df = future_dates_df
             
@@ -322,33 +379,128 @@ def _future_frame_pandas(
 # UTILITIES ------------------------------------------------------------------
 
 
-def _process_future_frame_subset(subset, date_column, group_names, length_out, freq, force_regular):
-    future_dates_list = []
-    for _, row in subset.iterrows():
-        future_dates = make_future_timeseries(
-            idx=pd.Series(row[date_column]), 
-            length_out=length_out,
-            freq=freq, 
-            force_regular=force_regular
-        )
+def _assemble_future_frame(last_dates_df, future_dates, date_column, group_names, length_out):
+    '''Build the future frame, repeating each group's keys `length_out` times.'''
+    return pd.DataFrame({
+        date_column: future_dates,
+        **{group_name: last_dates_df[group_name].array.repeat(length_out) for group_name in group_names}
+    })
+
+def _make_future_dates(last_dates, length_out, freq, show_progress=False):
+    '''Generate `length_out` future dates after each date in `last_dates`. 
+    
+    The result is laid out group by group, i.e. the first `length_out` dates 
+    belong to `last_dates[0]`, the next `length_out` to `last_dates[1]`, etc.
+    '''
+    offset = _get_offset(freq)
+    last_dates = pd.DatetimeIndex(last_dates)
+    tz = last_dates.tz
+    
+    # Calendar frequencies (business days, month ends, ...) need pandas to 
+    # roll the dates, either for all groups at once or group by group
+    if not isinstance(offset, Tick):
+        if _is_vectorized_offset(offset, tz):
+            future_ns = _make_future_offsets(last_dates, length_out, offset)
+        else:
+            future_ns = _compute_future_ns(last_dates, length_out, freq, show_progress)
         
-        future_dates_df = pd.DataFrame({date_column: future_dates})
-        for group_name in group_names:
-            future_dates_df[group_name] = row[group_name]
+        return _utc_ns_to_dates(future_ns, tz)
+    
+    # Fixed frequencies (hourly, daily, minutely, ...) are plain integer 
+    # arithmetic on nanoseconds, so all groups are computed in one shot. Like 
+    # `pd.date_range`, tz-aware dates are stepped in wall time for daily 
+    # frequencies and in absolute (UTC) time for sub-daily frequencies.
+    if tz is not None and not isinstance(offset, Day):
+        last_ns = last_dates.values.astype('datetime64[ns]').view('i8')
+        future_ns = _make_future_ticks(last_ns, offset.nanos, length_out)
         
-        future_dates_list.append(future_dates_df)
-    return future_dates_list
+        return _utc_ns_to_dates(future_ns, tz)
+    
+    if tz is not None:
+        last_dates = last_dates.tz_localize(None)
+    
+    last_ns = last_dates.values.astype('datetime64[ns]').view('i8')
+    
+    future_ns = _make_future_ticks(last_ns, offset.nanos, length_out)
+    
+    future_dates = pd.DatetimeIndex(future_ns.view('datetime64[ns]'))
+    if tz is not None:
+        future_dates = future_dates.tz_localize(tz)
+    
+    return future_dates
 
-def _process_future_frame_rows(row, date_column, group_names, length_out, freq, force_regular):
-    future_dates = make_future_timeseries(
-        idx=pd.Series(row[date_column]),
-        length_out=length_out,
-        freq=freq, 
-        force_regular=force_regular
-    )
+# Anchored calendar offsets that pandas adds to a whole DatetimeIndex at once 
+# and that give the same dates as stepping with `pd.date_range`
+_VECTORIZED_OFFSETS = (
+    offsets.Week, offsets.BusinessDay,
+    offsets.MonthBegin, offsets.MonthEnd, offsets.BusinessMonthBegin, offsets.BusinessMonthEnd,
+    offsets.QuarterBegin, offsets.QuarterEnd, offsets.BQuarterBegin, offsets.BQuarterEnd,
+    offsets.YearBegin, offsets.YearEnd, offsets.BYearBegin, offsets.BYearEnd,
+)
+
+def _is_vectorized_offset(offset, tz):
+    '''Check if future dates for `offset` are computed for all groups at once.'''
+    if isinstance(offset, Tick):
+        return True
+    
+    # Subclasses (e.g. custom business days) and tz-aware wall times are left 
+    # to `pd.date_range`
+    return tz is None and type(offset) in _VECTORIZED_OFFSETS
+
+def _make_future_offsets(last_dates, length_out, offset):
+    '''Step tz-naive `last_dates` by an anchored calendar offset, all groups at once. 
+    
+    Like `pd.date_range`, each date is first rolled forward onto the offset. The 
+    k-th future date is then that date plus `k * offset`, so the offsets act as 
+    a template shared by every group. Returns int64 nanoseconds.
+    '''
+    first_dates = last_dates + offset * 0
+    
+    return np.column_stack([
+        (first_dates + offset * k).values.astype('datetime64[ns]').view('i8')
+        for k in range(1, length_out + 1)
+    ]).ravel()
+
+def _compute_future_ns(last_dates, length_out, freq, show_progress=False):
+    '''Generate future dates one group at a time with `pd.date_range`. 
     
-    future_dates_df = pd.DataFrame({date_column: future_dates})
-    for group_name in group_names:
-        future_dates_df[group_name] = row[group_name]
+    Returns int64 nanoseconds (UTC for tz-aware dates) written into a single 
+    preallocated array, which keeps the results cheap to send between processes.
+    '''
+    offset = _get_offset(freq)
+    
+    future_ns = np.empty(len(last_dates) * length_out, dtype='i8')
+    
+    for i, last_date in enumerate(conditional_tqdm(last_dates, total=len(last_dates), display=show_progress, desc="Future framing...")):
+        future_range = pd.date_range(start=last_date, periods=length_out + 1, freq=offset)[1:]
+        
+        future_ns[i * length_out:(i + 1) * length_out] = future_range.values.astype('datetime64[ns]').view('i8')
+    
+    return future_ns
+
+def _utc_ns_to_dates(future_ns, tz):
+    future_dates = pd.DatetimeIndex(future_ns.view('datetime64[ns]'))
+    if tz is not None:
+        future_dates = future_dates.tz_localize('UTC').tz_convert(tz)
+    
+    return future_dates
+
+def _make_future_ticks(last_ns, delta_ns, length_out):
+    '''Add `1..length_out` steps of `delta_ns` nanoseconds to each of `last_ns`.'''
+    if _NUMBA_INSTALLED and last_ns.size * length_out >= _NUMBA_MIN_SIZE:
+        future_ns = np.empty(last_ns.size * length_out, dtype='i8')
+        _fill_future_ticks(np.ascontiguousarray(last_ns), delta_ns, length_out, future_ns)
+        return future_ns
+    
+    deltas = np.arange(1, length_out + 1, dtype='i8') * delta_ns
+    
+    return (last_ns[:, None] + deltas[None, :]).ravel()
+
+if _NUMBA_INSTALLED:
     
-    return future_dates_df
+    @njit(parallel=True, nogil=True, cache=True)
+    def _fill_future_ticks(last_ns, delta_ns, length_out, out):
+        for i in prange(last_ns.size):
+            base = last_ns[i]
+            for j in range(length_out):
+                out[i * length_out + j] = base + (j + 1) * delta_ns
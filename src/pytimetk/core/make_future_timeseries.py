@@ -6,6 +6,7 @@ from typing import Union, Optional, List
 from pytimetk.core.frequency import get_frequency
 
 from pytimetk.utils.checks import check_series_or_datetime
+from pytimetk.utils.datetime_helpers import _get_offset
 
 
 @pf.register_series_method
@@ -125,29 +126,33 @@ def make_future_timeseries(
     if len(idx) < 2:
         if freq is None:
             raise ValueError("`freq` must be provided if `idx` contains only 1 date.")
+        
+        # Fast path: a single date with a known frequency needs no inference
+        start = idx[0] if isinstance(idx, pd.DatetimeIndex) else idx.iloc[0]
+        
+        future_dates = pd.date_range(
+            start   = start, 
+            periods = length_out + 1, 
+            freq    = _get_offset(freq)
+        )[1:]
+        
+        return pd.Series(future_dates)
     
-    # If idx is a DatetimeIndex, convert to Series
-    if isinstance(idx, pd.DatetimeIndex):
-        idx = pd.Series(idx, name="idx")
-    
-    # Create a DatetimeIndex from the provided dates
-    dt_index = pd.DatetimeIndex(pd.Series(idx).values)
+    # Create a DatetimeIndex from the provided dates (keeps any timezone)
+    dt_index = pd.DatetimeIndex(idx)
     
     # Determine the frequency
     if freq is None:
         freq = get_frequency(dt_index, force_regular=force_regular)  
     
-    # Generate the next four periods (dates)
+    # Generate the next four periods (dates). `pd.date_range` takes the 
+    # timezone from `start`, so tz-aware dates need no re-localization.
     future_dates = pd.date_range(
         start   = dt_index[-1], 
         periods = length_out +1, 
         freq    = freq
     )[1:]  # Exclude the first date as it's already in dt_index
-
-    # If the original index has a timezone, apply it to the future dates
-    if idx.dt.tz is not None:
-        future_dates = future_dates.tz_localize(idx.dt.tz)
     
     ret = pd.Series(future_dates)
     
-    return ret
\ No newline at end of file
+    return ret
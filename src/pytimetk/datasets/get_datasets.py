@@ -1,12 +1,14 @@
 
 import pandas as pd
 import polars as pl
+import functools
 from importlib.resources import files
     
 def load_dataset(
     name: str = "m4_daily", 
     verbose: bool = False, 
     engine: str = 'pandas',
+    use_pyarrow: bool = False,
     **kwargs
 ) -> pd.DataFrame:
     '''
@@ -52,9 +54,18 @@ def load_dataset(
         the csv file. The default value is set to "pandas", which uses pandas to 
         read the csv file. If `engine` is set to "polars", the function will use 
         polars to read the csv file and convert it to a pandas DataFrame.
+    use_pyarrow : bool, optional
+        The `use_pyarrow` parameter is a boolean flag that determines whether 
+        `pandas.read_csv` uses its "pyarrow" parser instead of the default 
+        parser. The pyarrow parser is faster for the larger datasets but does 
+        not support all of the `pandas.read_csv` arguments and may infer 
+        different column types (e.g. it parses dates automatically). Only used 
+        when `engine` is "pandas". The default value is `False`.
     **kwargs
         The `**kwargs` parameter is used to pass additional arguments to 
-        `pandas.read_csv`.
+        `pandas.read_csv`. When the only argument is `parse_dates` and it lists 
+        all of the dataset's date columns, a bundled parquet copy with the 
+        dates already parsed is read instead, which is faster.
     
     Returns
     -------
@@ -79,26 +90,37 @@ def load_dataset(
     df
     ```    
     '''
-    # Return the list of available datasets
-    dataset_list = get_available_datasets()
-    
     if verbose:
         print("Available Datasets:")
-        print(dataset_list)
+        print(get_available_datasets())
         
-    if name not in dataset_list:
-        raise ValueError(f"Dataset {name} not found. Please choose from the following: \n{dataset_list}")
+    if name not in _get_dataset_name_set():
+        raise ValueError(f"Dataset {name} not found. Please choose from the following: \n{get_available_datasets()}")
+    
+    # Each csv is shipped with a parquet copy that stores the date columns as 
+    # native datetimes. It is used when `parse_dates` asks for exactly those 
+    # columns, which skips both csv and date parsing.
+    parquet_path = files("pytimetk.datasets").joinpath(f"{name}.parquet")
+    
+    if engine == 'pandas' and not use_pyarrow and set(kwargs) == {'parse_dates'} and parquet_path.is_file():
+        with parquet_path.open('rb') as f:
+            if _get_parquet_date_columns(f) == _as_column_set(kwargs['parse_dates']):
+                f.seek(0)
+                return pd.read_parquet(f)
     
-    # Load the dataset
-    package_path = files('pytimetk')
-    # Reference to the a file within the package
-    text_path = f"{package_path}/datasets/{name}.csv"
+    # Reference to the file within the package. Files are opened in binary 
+    # mode so the parser decodes the bytes itself.
+    csv_path = files("pytimetk.datasets").joinpath(f"{name}.csv")
     
     if engine == 'pandas':
-        with open(text_path, 'r', encoding='utf-8') as f:
+        if use_pyarrow:
+            kwargs = {'engine': 'pyarrow', **kwargs}
+        
+        with csv_path.open('rb') as f:
             df = pd.read_csv(f, **kwargs)
     elif engine == 'polars':
-        df = pl.read_csv(text_path).to_pandas()
+        with csv_path.open('rb') as f:
+            df = pl.read_csv(f).to_pandas()
 
     return df
 
@@ -127,10 +149,36 @@ def get_available_datasets():
     
     '''
     
-    pathlist   = list(files("pytimetk.datasets").iterdir())
-    file_names = [path.name for path in pathlist]
-    dataset_list = [item for item in file_names if item.endswith(".csv")]
-    dataset_list = [name.rstrip('.csv') for name in dataset_list]
-    dataset_list = sorted(dataset_list)
+    return list(_get_dataset_names())
+
+
+# UTILITIES ------------------------------------------------------------------
+
+@functools.lru_cache(maxsize=1)
+def _get_dataset_names():
+    '''Sorted tuple of the dataset names shipped in `pytimetk.datasets`, cached.'''
+    dataset_list = sorted(
+        path.name[:-len(".csv")] 
+        for path in files("pytimetk.datasets").iterdir() 
+        if path.name.endswith(".csv")
+    )
+    
+    return tuple(dataset_list)
+
+@functools.lru_cache(maxsize=1)
+def _get_dataset_name_set():
+    return frozenset(_get_dataset_names())
+
+def _as_column_set(parse_dates):
+    '''Column names requested by `parse_dates`, or None if it is not a plain list of names.'''
+    if isinstance(parse_dates, (list, tuple)) and all(isinstance(col, str) for col in parse_dates):
+        return set(parse_dates)
+    return None
+
+def _get_parquet_date_columns(f):
+    '''Names of the datetime columns stored in a parquet file, read from its schema.'''
+    import pyarrow as pa
+    import pyarrow.parquet as pq
     
-    return dataset_list
+    schema = pq.read_schema(f)
+    return {field.name for field in schema if pa.types.is_timestamp(field.type)}
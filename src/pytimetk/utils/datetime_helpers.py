@@ -4,6 +4,7 @@ import polars as pl
 import pandas_flavor as pf
 
 import re
+import functools
 from datetime import datetime
 from dateutil import parser
 from warnings import warn
@@ -631,3 +632,10 @@ def get_timeseries_colname(data: pd.DataFrame, verbose: bool = False) -> str:
         print(detect_timeseries_columns(data).iloc[0])
         
     return detect_timeseries_columns(data).iloc[0].idxmax()
+
+@functools.lru_cache(maxsize=128)
+def _get_offset(freq):
+    '''Convert a frequency string to a pandas DateOffset, caching the result.'''
+    from pandas.tseries.frequencies import to_offset
+    
+    return to_offset(freq)
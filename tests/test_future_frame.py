@@ -166,9 +166,141 @@ def test_example_5():
     
     
     assert extended_df.shape[0] == 16266
-    
-    
-    
+
+def test_future_frame_threads():
+
+    import pytimetk as tk
+
+    df = tk.load_dataset('m4_monthly', parse_dates = ['date'])
+
+    kwargs = dict(date_column = 'date', length_out = 12, show_progress = False)
+
+    expected_df = df.groupby('id', sort = False).future_frame(threads = 1, **kwargs)
+
+    result_df = df.groupby('id', sort = False).future_frame(threads = 2, **kwargs)
+
+    assert_frame_equal(result_df, expected_df)
+
+    # More threads than groups
+    result_df = df.groupby('id', sort = False).future_frame(threads = 8, **kwargs)
+
+    assert_frame_equal(result_df, expected_df)
+
+def test_future_frame_grouped_tz_aware():
+
+    dates = pd.to_datetime(['2021-03-11', '2021-03-12', '2021-03-13']).tz_localize('US/Eastern')
+
+    df_tz = pd.DataFrame({'id': ['a'] * 3 + ['b'] * 3, 'date': dates.append(dates)})
+
+    result_df = df_tz.groupby('id').future_frame(
+        date_column = 'date', length_out = 3, bind_data = False, show_progress = False
+    )
+
+    # Daily steps are taken in wall time across the DST change, like pd.date_range
+    expected_dates = pd.date_range('2021-03-14', periods = 3, freq = 'D', tz = 'US/Eastern')
+
+    expected_df = pd.DataFrame({
+        'date': expected_dates.append(expected_dates),
+        'id': ['a'] * 3 + ['b'] * 3,
+    })
+
+    assert_frame_equal(result_df, expected_df)
+
+def test_future_frame_grouped_tz_aware_hourly():
+
+    # Hourly steps across the spring forward and fall back DST changes are 
+    # taken in absolute time, like pd.date_range
+    for start in ['2021-03-13 20:00', '2021-11-06 23:00']:
+
+        dates = pd.date_range(start, periods = 4, freq = 'h', tz = 'US/Eastern')
+
+        df_tz = pd.DataFrame({'id': ['a'] * 4 + ['b'] * 4, 'date': dates.append(dates)})
+
+        result_df = df_tz.groupby('id').future_frame(
+            date_column = 'date', length_out = 8, bind_data = False, show_progress = False
+        )
+
+        expected_dates = pd.date_range(dates[-1], periods = 9, freq = 'h')[1:]
+
+        expected_df = pd.DataFrame({
+            'date': expected_dates.append(expected_dates),
+            'id': ['a'] * 8 + ['b'] * 8,
+        })
+
+        assert_frame_equal(result_df, expected_df)
+
+def test_future_frame_length_out_zero():
+
+    # DataFrame
+    assert_frame_equal(df.future_frame(date_column = 'date', length_out = 0), df)
+
+    result_df = df.future_frame(date_column = 'date', length_out = 0, bind_data = False)
+
+    assert result_df.columns.tolist() == ['date'] and result_df.empty
+
+    # GroupBy
+    df_grouped = df.assign(id = 'a')
+
+    result_df = df_grouped.groupby('id').future_frame(date_column = 'date', length_out = 0)
+
+    assert_frame_equal(result_df, df_grouped)
+
+    result_df = df_grouped.groupby('id').future_frame(date_column = 'date', length_out = 0, bind_data = False)
+
+    assert result_df.columns.tolist() == ['date', 'id'] and result_df.empty
+
+def test_future_frame_single_group_threads():
+
+    result_df = df_irr.assign(id = 'a').groupby('id').future_frame(
+        date_column = 'date', length_out = 2, bind_data = False, threads = 2, show_progress = False
+    )
+
+    expected_df = pd.DataFrame({
+        'date': pd.to_datetime(['2022-01-17', '2022-01-18']),
+        'id': ['a', 'a'],
+    })
+
+    assert_frame_equal(result_df, expected_df)
+
+def test_future_frame_calendar_offsets():
+
+    df_cal = pd.DataFrame({
+        'id': ['a'] * 3 + ['b'] * 3,
+        'date': pd.to_datetime(['2021-01-31', '2021-02-28', '2021-03-31', '2020-06-30', '2020-07-31', '2020-08-15']),
+    })
+
+    for freq in ['M', 'MS', 'Q', 'BA', 'W-WED', 'B']:
+
+        result_df = df_cal.groupby('id').future_frame(
+            date_column = 'date', length_out = 5, freq = freq, bind_data = False, show_progress = False
+        )
+
+        expected_dates = [pd.date_range(d, periods = 6, freq = freq)[1:] for d in ['2021-03-31', '2020-08-15']]
+
+        expected_df = pd.DataFrame({
+            'date': expected_dates[0].append(expected_dates[1]),
+            'id': ['a'] * 5 + ['b'] * 5,
+        })
+
+        assert_frame_equal(result_df, expected_df)
+
+def test_fill_future_ticks():
+
+    pytest.importorskip('numba')
+
+    from pytimetk.core.future import _fill_future_ticks
+
+    last_ns = pd.to_datetime(['2021-01-01 00:00', '2021-06-01 12:00']).values.view('i8')
+    delta_ns = pd.Timedelta('1H').value
+
+    result = np.empty(2 * 3, dtype='i8')
+    _fill_future_ticks(last_ns, delta_ns, 3, result)
+
+    expected = (last_ns[:, None] + np.arange(1, 4) * delta_ns).ravel()
+
+    np.testing.assert_array_equal(result, expected)
+
+
 
 # Run the tests
 if __name__ == "__main__":
@@ -144,3 +144,91 @@ def test_load_dataset():
         
     
     
+
+def test_get_available_datasets():
+    """Test if get_available_datasets returns the dataset names without the .csv extension"""
+    
+    dataset_list = pytimetk.get_available_datasets()
+    
+    assert isinstance(dataset_list, list), \
+        'The dataset names are not a list!'
+    
+    assert dataset_list == sorted(dataset_list), \
+        'The dataset names are not sorted!'
+    
+    assert 'm4_daily' in dataset_list and 'expedia' in dataset_list, \
+        'The dataset names are missing datasets!'
+    
+    assert not any(name.endswith('.csv') for name in dataset_list), \
+        'The dataset names still have the .csv extension!'
+
+
+def test_get_available_datasets_strips_only_the_extension(monkeypatch):
+    """Test if only the .csv suffix is removed from names that end in its letters"""
+    
+    import importlib
+    from types import SimpleNamespace
+    
+    get_datasets = importlib.import_module('pytimetk.datasets.get_datasets')
+    
+    listing = [SimpleNamespace(name=name) for name in ['foo_cvs.csv', 'vsc.csv', 'bar.parquet', '__init__.py']]
+    
+    monkeypatch.setattr(get_datasets, 'files', lambda package: SimpleNamespace(iterdir=lambda: iter(listing)))
+    
+    get_datasets._get_dataset_names.cache_clear()
+    get_datasets._get_dataset_name_set.cache_clear()
+    
+    try:
+        assert pytimetk.get_available_datasets() == ['foo_cvs', 'vsc']
+    finally:
+        get_datasets._get_dataset_names.cache_clear()
+        get_datasets._get_dataset_name_set.cache_clear()
+
+def test_load_dataset_use_pyarrow():
+    """Test if load_dataset works with the pyarrow csv parser"""
+    
+    data = pytimetk.load_dataset("m4_daily", use_pyarrow = True)
+    
+    assert data.shape == (9743, 3), \
+        'The dataset has the wrong shape!'
+        
+    assert data.columns.tolist() == ['id', 'date', 'value'], \
+        'The dataset has the wrong columns!'
+
+def test_load_dataset_python_engine_kwargs():
+    """Test if arguments that need the python csv parser are still supported"""
+    
+    data = pytimetk.load_dataset("m4_daily", skipfooter = 1)
+    
+    assert data.shape == (9742, 3), \
+        'The dataset has the wrong shape!'
+    
+    data = pytimetk.load_dataset("m4_daily", sep = None)
+    
+    assert data.shape == (9743, 3), \
+        'The dataset has the wrong shape!'
+
+def test_load_dataset_parquet_matches_csv():
+    """Test if the parquet copy of a dataset loads the same data as the csv"""
+    
+    from importlib.resources import files
+    
+    for name, parse_dates in [('m4_hourly', ['date']), ('expedia', ['date_time', 'srch_ci', 'srch_co'])]:
+        
+        csv_path = files("pytimetk.datasets").joinpath(f"{name}.csv")
+        
+        expected = pd.read_csv(csv_path, parse_dates = parse_dates)
+        
+        data = pytimetk.load_dataset(name, parse_dates = parse_dates)
+        
+        pd.testing.assert_frame_equal(data, expected)
+    
+    # Only some of the date columns: falls back to the csv
+    data = pytimetk.load_dataset('expedia', parse_dates = ['date_time'])
+    
+    assert data['srch_ci'].dtype == object, \
+        'The unrequested date column was parsed!'
+    
+    # Unknown date column: same error as pandas.read_csv
+    with pytest.raises(ValueError):
+        pytimetk.load_dataset('m4_daily', parse_dates = ['wrong_name'])
@@ -85,4 +85,34 @@ def test_make_future_timeseries_compound_freq():
 
     
     
-    
\ No newline at end of file
+    
+def test_make_future_timeseries_single_date():
+    
+    # Single date with a known frequency
+    idx = pd.Series(pd.to_datetime(["2011-01-01 12:00:00"]).tz_localize("US/Eastern"))
+    
+    result_1 = tk.make_future_timeseries(idx, 3, freq="H")
+    
+    expect = pd.Series(pd.date_range("2011-01-01 13:00:00", periods=3, freq="H", tz="US/Eastern"))
+    
+    assert_series_equal(result_1, expect)
+    
+    # Single date without a frequency
+    with pytest.raises(ValueError):
+        tk.make_future_timeseries(idx, 3)
+
+def test_make_future_timeseries_tz_aware():
+    
+    # Multiple tz-aware dates keep their wall times and timezone
+    idx = pd.Series(pd.date_range("2021-03-13 20:00", periods=4, freq="H", tz="US/Eastern"))
+    
+    result_1 = tk.make_future_timeseries(idx, 3)
+    
+    expect = pd.Series(pd.date_range("2021-03-14 00:00", periods=3, freq="H", tz="US/Eastern"))
+    
+    assert_series_equal(result_1, expect)
+    
+    # Same result as the single date fast path
+    result_2 = tk.make_future_timeseries(idx.iloc[-1:], 3, freq="H")
+    
+    assert_series_equal(result_2, expect)